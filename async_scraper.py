@@ -1,85 +1,211 @@
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+import csv
 from bs4 import BeautifulSoup
 import time
+import logging
 import random
 import re
 import tempfile
 import shutil
 import os
+import queue
+import atexit
+import json
+import sqlite3
+import argparse
+import asyncio
+import fnmatch
+import importlib.util
+from urllib.parse import urlsplit
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
 
-def extract_fitment_data(soup):
+log = logging.getLogger(__name__)
+LOG_FORMAT = '%(message)s'
+
+# File types the scraper never reads; blocked via CDP to cut page-load bytes
+BLOCKED_EXTENSIONS = ['png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'woff', 'woff2', 'ttf', 'css']
+BLOCKED_HOSTS = ['google-analytics', 'googletagmanager', 'doubleclick', 'facebook.net']
+
+# Patterns match the whole URL, so cover versioned assets (app.css?v=123) and upper-case extensions too
+BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in BLOCKED_EXTENSIONS
+    for variant in (ext, ext.upper())
+    for pattern in (f"*.{variant}", f"*.{variant}?*")
+] + [f"*{host}*" for host in BLOCKED_HOSTS]
+
+# The same patterns as one case-insensitive regex, for blocking requests in Playwright's route handler
+BLOCKED_URL_RE = re.compile(
+    '|'.join(fnmatch.translate(pattern) for pattern in BLOCKED_URL_PATTERNS), re.IGNORECASE
+)
+
+# Playwright knows each request's type, which catches assets whose URL has no extension
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'stylesheet', 'media'}
+
+# Same user agent for Chrome and the plain HTTP fast path
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
+
+# Product fields kept in the output, in column order
+ALLOWED_KEYS = [
+    'Product Title', 'Product Subtitle', 'Manufacturer Info', 'SKU', 
+    'Other Names', 'Description', 'Description 2', 'Replaces',  
+    'MSRP', 'Discount', 'Sale Price', 'Condition', 'Install Time', 'Applications', 'Notes'
+]
+
+# Per-fitment columns added to every product row
+FITMENT_COLUMNS = ['Year', 'Make', 'Model', 'Body & Trim', 'Engine & Transmission']
+
+# <td> classes extract_fitment_data reads from each fitment row
+FITMENT_CELL_CLASSES = {'fitment-year', 'fitment-make', 'fitment-model', 'fitment-trim', 'fitment-engine'}
+
+# Per-driver Chrome HTTP cache limit in bytes
+DISK_CACHE_SIZE = 32 * 1024 * 1024
+
+# tmpfs space to reserve per driver for its profile: the disk cache plus headroom for LevelDBs, cookies etc.
+SHM_PROFILE_BUDGET = DISK_CACHE_SIZE + 64 * 1024 * 1024
+
+# Elements parse_product_soup reads, keyed by (tag, class) and matched in a single select() walk
+PRODUCT_ELEMENTS = {
+    ('h1', 'product-title'): 'title',
+    ('p', 'product-subtitle'): 'subtitle',
+    ('div', 'description_body'): 'description',
+    ('span', 'list-price-value'): 'msrp',
+    ('strong', 'sale-price-value'): 'sale_price',
+    ('ul', 'field-list'): 'field_list',
+    ('table', 'fitment-table'): 'fitment_table',
+    ('li', 'notes'): 'notes',
+}
+# Bare strong is included for the "Genuine Mopar Parts" manufacturer label, matched by text
+PRODUCT_SELECTOR = ', '.join(f'{tag}.{cls}' for tag, cls in PRODUCT_ELEMENTS) + ', strong'
+
+# HEAD responses that mean a URL should be skipped without opening a browser
+SKIP_STATUS_CODES = {404, 410, 429}
+
+# Cached scrape results older than this are refetched
+CACHE_MAX_AGE = 7 * 86400
+
+def extract_fitment_data(fitment_table):
     """
-    Extract vehicle fitment data from the product page
+    Extract vehicle fitment data from the product page's fitment table
     Returns: list of dictionaries with year, make, model, trim, engine
     """
     fitments = []
     
     try:
-        # Find the fitment table
-        fitment_table = soup.find('table', class_='fitment-table')
         if not fitment_table:
-            print("    Warning: fitment-table not found in page HTML")
+            log.warning("    Warning: fitment-table not found in page HTML")
             return fitments
         
-        print("    Debug: fitment-table found in HTML")
+        log.debug("    Debug: fitment-table found in HTML")
         
         # Try to find tbody first, fallback to table
         tbody = fitment_table.find('tbody', class_='fitment-table-body')
         if tbody:
             rows = tbody.find_all('tr', class_='fitment-row')
-            print(f"    Debug: Found tbody with {len(rows)} rows")
+            log.debug(f"    Debug: Found tbody with {len(rows)} rows")
         else:
             rows = fitment_table.find_all('tr', class_='fitment-row')
-            print(f"    Debug: Found table with {len(rows)} rows (no tbody)")
+            log.debug(f"    Debug: Found table with {len(rows)} rows (no tbody)")
         
-        print(f"    Found {len(rows)} fitment rows in table")
+        log.info(f"    Found {len(rows)} fitment rows in table")
         
         for idx, row in enumerate(rows):
-            year_td = row.find('td', class_='fitment-year')
-            make_td = row.find('td', class_='fitment-make')
-            model_td = row.find('td', class_='fitment-model')
-            trim_td = row.find('td', class_='fitment-trim')
-            engine_td = row.find('td', class_='fitment-engine')
+            # Index the row's own cells by their known fitment class in one pass instead of one find() per column
+            cells = {}
+            for td in row.find_all('td', recursive=False):
+                for cls in td.get('class', []):
+                    if cls in FITMENT_CELL_CLASSES:
+                        cells[cls] = td.text.strip()
             
-            if year_td and make_td and model_td:
+            if 'fitment-year' in cells and 'fitment-make' in cells and 'fitment-model' in cells:
                 fitment = {
-                    'Year': year_td.text.strip() if year_td else '',
-                    'Make': make_td.text.strip() if make_td else '',
-                    'Model': model_td.text.strip() if model_td else '',
-                    'Body & Trim': trim_td.text.strip() if trim_td else '',
-                    'Engine & Transmission': engine_td.text.strip() if engine_td else ''
+                    'Year': cells['fitment-year'],
+                    'Make': cells['fitment-make'],
+                    'Model': cells['fitment-model'],
+                    'Body & Trim': cells.get('fitment-trim', ''),
+                    'Engine & Transmission': cells.get('fitment-engine', '')
                 }
                 fitments.append(fitment)
-                print(f"      Row {idx + 1}: {fitment['Year']} {fitment['Make']} {fitment['Model']}")
+                log.debug("      Row %d: %s %s %s", idx + 1, fitment['Year'], fitment['Make'], fitment['Model'])
         
         if len(fitments) == 0:
-            print("    Warning: No valid fitment rows found")
+            log.warning("    Warning: No valid fitment rows found")
         
         return fitments
     
     except Exception as e:
-        print(f"    Error extracting fitment data: {e}")
+        log.error(f"    Error extracting fitment data: {e}")
         return fitments
 
-def create_driver_with_profile():
+# chromedriver binary path, resolved once per run
+_CHROMEDRIVER_PATH = None
+
+def get_chromedriver_path():
+    """
+    Resolve the chromedriver binary on first call and reuse it afterwards
+    Prefers CHROMEDRIVER_PATH or a system install, falling back to webdriver_manager
+    """
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        system_path = os.environ.get('CHROMEDRIVER_PATH') or shutil.which('chromedriver')
+        if system_path and os.path.isfile(system_path):
+            _CHROMEDRIVER_PATH = system_path
+        else:
+            # Only needed when no chromedriver is installed; checks versions over the network
+            from webdriver_manager.chrome import ChromeDriverManager
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        log.info(f"Using chromedriver: {_CHROMEDRIVER_PATH}")
+    return _CHROMEDRIVER_PATH
+
+# Number of Chrome drivers expected to share /dev/shm, set by init_worker
+_shm_driver_count = 1
+
+def get_profile_parent_dir():
+    """
+    Pick where Chrome profiles go: /dev/shm (RAM) when it has room for every driver, else the default temp dir
+    /dev/shm is often tiny (64 MB in Docker), and filling it crashes Chrome with ENOSPC
+    """
+    shm_dir = '/dev/shm'
+    if not os.path.isdir(shm_dir) or not os.access(shm_dir, os.W_OK):
+        return None
+    try:
+        free = shutil.disk_usage(shm_dir).free
+    except OSError:
+        return None
+    if free < _shm_driver_count * SHM_PROFILE_BUDGET:
+        log.debug(f"    /dev/shm has {free // (1024 * 1024)} MB free, using the default temp dir for profiles")
+        return None
+    return shm_dir
+
+def create_driver_with_profile(driver_path):
     """
     Create a headless Chrome driver with a separate temporary profile
     Optimized for AWS EC2 Ubuntu instances
     """
-    # Create a temporary directory for this profile
-    profile_path = tempfile.mkdtemp(prefix='chrome_profile_')
+    # Create a temporary directory for this profile, in RAM (tmpfs) where available
+    profile_path = tempfile.mkdtemp(prefix='chrome_profile_', dir=get_profile_parent_dir())
     
     options = webdriver.ChromeOptions()
     
+    # Return from driver.get() at DOMContentLoaded instead of waiting for every subresource
+    options.page_load_strategy = 'eager'
+    
     # Use the temporary profile directory
     options.add_argument(f'--user-data-dir={profile_path}')
     
+    # Keep the HTTP cache inside the profile and bound it, since it may live in RAM
+    options.add_argument(f'--disk-cache-dir={os.path.join(profile_path, "cache")}')
+    options.add_argument(f'--disk-cache-size={DISK_CACHE_SIZE}')
+    
     # AWS/Ubuntu critical settings - must come first
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
@@ -89,7 +215,7 @@ def create_driver_with_profile():
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--window-size=1920,1080')
-    options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36')
+    options.add_argument(f'--user-agent={USER_AGENT}')
     options.add_argument('--ignore-certificate-errors')
     options.add_argument('--ignore-ssl-errors=yes')
     
@@ -100,14 +226,32 @@ def create_driver_with_profile():
     options.add_argument('--no-first-run')
     options.add_argument('--disable-default-apps')
     
+    # Don't download images at all
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
     # Suppress unnecessary logs
     options.add_argument('--log-level=3')
     
     # AWS EC2 specific setuid sandbox
     options.add_argument('--disable-setuid-sandbox')
     
-    service = Service(ChromeDriverManager().install())
+    # Small EC2 instances: fewer Chrome processes and a capped V8 heap so more workers fit in RAM
+    # Opt-in because --single-process can destabilize Chrome on complex pages
+    if os.environ.get('EC2_SMALL') == '1':
+        options.add_argument('--single-process')
+        options.add_argument('--renderer-process-limit=1')
+        options.add_argument('--disable-software-rasterizer')
+        options.add_argument('--memory-pressure-off')
+        options.add_argument('--js-flags=--max-old-space-size=256')
+    
+    service = Service(driver_path)
     driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(20)
+    driver.set_script_timeout(10)
+    
+    # Block images, fonts, stylesheets and trackers for every page this driver loads
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     
     return driver, profile_path
 
@@ -118,265 +262,867 @@ def cleanup_profile(profile_path):
     try:
         shutil.rmtree(profile_path, ignore_errors=True)
     except Exception as e:
-        print(f"    Warning: Could not clean up profile directory: {e}")
+        log.warning(f"    Warning: Could not clean up profile directory: {e}")
 
-def extract_product_data(url):
+def reset_driver(driver):
     """
-    Extract product data from a Mopar parts page using Selenium
+    Reset browser state between URLs so a reused driver behaves like a fresh one
+    The HTTP cache is kept so the site's JS bundles are not refetched for every URL
+    """
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+def warm_driver(driver, warm_url):
+    """
+    Load the site's origin once so DNS, TLS and connection setup are done before the first product URL
+    """
+    try:
+        driver.get(warm_url)
+        reset_driver(driver)
+        log.debug(f"    Warmed up connection to {warm_url}")
+    except Exception as e:
+        log.info(f"    Note: Could not warm up {warm_url}: {e}")
+
+def get_origin(url):
+    """
+    Return the scheme://host/ part of a URL
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+class DriverPool:
+    """
+    Pool of long-lived headless Chrome drivers
+    Each driver keeps its own temporary profile and is reused across many URLs
+    """
+    def __init__(self, size=1, warm_url=None):
+        self.driver_path = get_chromedriver_path()
+        self.warm_url = warm_url
+        self._available = queue.Queue()
+        self._entries = []
+        self._closed = False
+        
+        for _ in range(size):
+            entry = self._create()
+            self._entries.append(entry)
+            self._available.put(entry)
+        
+        log.info(f"Started {size} Chrome driver(s)")
+        atexit.register(self.close)
+    
+    def acquire(self, timeout=300):
+        """
+        Take a driver from the pool, blocking until one is free
+        An empty slot gets a fresh driver here; if that fails the slot stays empty and the error is raised
+        Raises queue.Empty if no slot frees up within timeout seconds
+        Returns: (driver, profile_path) tuple
+        """
+        entry = self._available.get(timeout=timeout)
+        if entry is None:
+            try:
+                entry = self._create()
+            except Exception:
+                self._available.put(None)
+                raise
+            self._entries.append(entry)
+        return entry
+    
+    def release(self, entry):
+        """
+        Reset a driver and hand it back to the pool
+        A driver that can no longer be reset is discarded and its slot refilled on the next acquire()
+        """
+        driver, profile_path = entry
+        try:
+            reset_driver(driver)
+        except Exception as e:
+            log.warning(f"    Warning: Driver reset failed, replacing it: {e}")
+            self._discard(entry)
+            entry = None
+        self._available.put(entry)
+    
+    def _create(self):
+        entry = create_driver_with_profile(self.driver_path)
+        if self.warm_url:
+            warm_driver(entry[0], self.warm_url)
+        return entry
+    
+    def _discard(self, entry):
+        driver, profile_path = entry
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        cleanup_profile(profile_path)
+        if entry in self._entries:
+            self._entries.remove(entry)
+    
+    def close(self):
+        """
+        Quit every driver and remove its temporary profile
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for entry in list(self._entries):
+            self._discard(entry)
+
+def parse_product_soup(soup):
+    """
+    Extract product fields and fitments from a parsed product page
+    Shared by the Selenium path and the static HTML fast path
     Returns: list of dictionaries, one for each fitment (year/make/model)
     """
-    driver = None
-    profile_path = None
+    data = {}
+    
+    # Walk the tree once, routing each matched element by tag and class
+    first = {}
+    field_lists = []
+    notes_items = []
+    for elem in soup.select(PRODUCT_SELECTOR):
+        field = None
+        for cls in elem.get('class', []):
+            field = PRODUCT_ELEMENTS.get((elem.name, cls))
+            if field:
+                break
+        
+        if field == 'field_list':
+            field_lists.append(elem)
+        elif field == 'notes':
+            notes_items.append(elem)
+        elif field:
+            first.setdefault(field, elem)
+        elif elem.name == 'strong' and elem.string == 'Genuine Mopar Parts':
+            first.setdefault('manufacturer', elem)
+    
+    # Extract product title
+    title_elem = first.get('title')
+    data['Product Title'] = title_elem.text.strip() if title_elem else ''
+    
+    # Extract product subtitle
+    subtitle_elem = first.get('subtitle')
+    data['Product Subtitle'] = subtitle_elem.text.strip() if subtitle_elem else ''
     
+    # Extract manufacturer info
+    manufacturer_strong = first.get('manufacturer')
+    data['Manufacturer Info'] = manufacturer_strong.text.strip() if manufacturer_strong else ''
+    
+    # Extract fields from ALL field-lists
+    field_tracker = {}
+    
+    for field_list in field_lists:
+        items = field_list.find_all('li')
+        for item in items:
+            label_elem = item.find(['label', 'span'], class_='list-label')
+            value_elem = item.find(['span', 'h2'], class_=['list-value', 'sku-display'])
+            
+            if not label_elem or not value_elem:
+                continue
+            
+            label = label_elem.text.strip().replace(':', '').strip()
+            value = value_elem.text.strip()
+            
+            if not label or label[:1] == '$' or label.isdigit():
+                continue
+            
+            if label in field_tracker:
+                field_tracker[label] += 1
+                field_name = f"{label} {field_tracker[label]}"
+            else:
+                field_tracker[label] = 1
+                field_name = label
+            
+            data[field_name] = value
+    
+    # Extract description
+    description_div = first.get('description')
+    if description_div:
+        description_text = description_div.get_text(separator=' ', strip=True)
+        data['Description'] = description_text
+    
+    # Extract notes
+    if notes_items:
+        notes_list = [item.get_text(strip=True) for item in notes_items]
+        data['Notes'] = ' | '.join(notes_list)
+    
+    # Extract pricing
+    msrp_elem = first.get('msrp')
+    if msrp_elem:
+        data['MSRP'] = msrp_elem.text.strip()
+    
+    sale_price_elem = first.get('sale_price')
+    if sale_price_elem:
+        data['Sale Price'] = sale_price_elem.text.strip()
+    
+    # Extract vehicle fitment data
+    fitments = extract_fitment_data(first.get('fitment_table'))
+    
+    # Filter to allowed keys
+    filtered_data = {k: data[k] for k in ALLOWED_KEYS if k in data}
+    
+    # Create a row for each fitment
+    result_rows = []
+    if fitments:
+        for fitment in fitments:
+            row = filtered_data.copy()
+            row.update(fitment)
+            result_rows.append(row)
+    else:
+        row = filtered_data.copy()
+        for column in FITMENT_COLUMNS:
+            row[column] = ''
+        result_rows.append(row)
+    
+    return result_rows
+
+# Per-process HTTP session for the static fast path, keeps connections alive
+_http_session = None
+
+def get_http_session():
+    """
+    Return this process's shared requests session
+    """
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        _http_session.headers.update({'User-Agent': USER_AGENT})
+        # Enough pooled connections for the playwright backend's concurrent threads
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _http_session.mount('http://', adapter)
+        _http_session.mount('https://', adapter)
+    return _http_session
+
+def url_is_live(url):
+    """
+    Cheap HEAD check so missing or rate-limited URLs never reach a browser
+    Only 404/410 (gone) and 429 (rate limited) skip the URL; other errors such as bot-protection
+    401/403 or a transient 5xx go on to the normal fetch, as do network errors
+    Returns: False only when the server says the page is gone or we are rate limited
+    """
+    try:
+        resp = get_http_session().head(url, allow_redirects=True, timeout=5)
+    except Exception as e:
+        log.debug(f"    HEAD request failed, trying the page anyway: {e}")
+        return True
+    
+    if resp.status_code in SKIP_STATUS_CODES:
+        log.warning(f"    Warning: HEAD returned {resp.status_code}, skipping")
+        return False
+    return True
+
+def try_static_fetch(url):
+    """
+    Try to read the product page without a browser
+    Only succeeds when the title and the complete fitment table are in the server-rendered HTML
+    Returns: list of product rows, or None to fall back to Selenium
+    """
     try:
-        # Create driver with unique profile
-        driver, profile_path = create_driver_with_profile()
-        print(f"    Created fresh Chrome profile for this request")
+        resp = get_http_session().get(url, timeout=15)
+        if resp.status_code != 200:
+            return None
         
-        driver.get(url)
+        soup = BeautifulSoup(resp.text, 'lxml')
+        
+        # The expander loads rows that aren't in the initial HTML, so only a browser sees them all
+        if soup.select_one('.fitment-expander'):
+            log.debug("    Fitment expander present, static HTML would be truncated")
+            return None
+        
+        # Without a title or any fitment row the page needs JavaScript to render; checked before
+        # parsing so JS-rendered pages don't log missing-table warnings ahead of the real scrape
+        if not soup.select_one('h1.product-title') or not soup.select_one('table.fitment-table tr.fitment-row'):
+            return None
+        
+        product_rows = parse_product_soup(soup)
+        if not product_rows[0].get('Year'):
+            return None
+        
+        return product_rows
+    except Exception as e:
+        log.info(f"    Note: Static fetch failed, falling back to Selenium: {e}")
+        return None
+
+def count_fitment_rows(driver):
+    """
+    Count fitment rows currently rendered in the page
+    """
+    return len(driver.find_elements(By.CSS_SELECTOR, "tr.fitment-row"))
+
+def wait_for_stable_row_count(driver, timeout):
+    """
+    Wait until the fitment row count is non-zero and unchanged across two polls 250 ms apart
+    Returns: True if the count settled, False on timeout
+    """
+    last_count = [-1]
+    
+    def row_count_settled(d):
+        count = count_fitment_rows(d)
+        settled = count > 0 and count == last_count[0]
+        last_count[0] = count
+        return settled
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(row_count_settled)
+        return True
+    except Exception:
+        return False
+
+def extract_product_data(url, driver):
+    """
+    Extract product data from a Mopar parts page using Selenium
+    The driver is borrowed from a DriverPool and is not quit here
+    Returns: list of dictionaries, one for each fitment (year/make/model)
+    """
+    try:
+        try:
+            driver.get(url)
+        except TimeoutException:
+            # Slow tail resources shouldn't block us; the element waits below decide
+            log.info("    Note: Page load timed out, continuing with element waits")
         
         # Wait for product title
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.CLASS_NAME, "product-title"))
         )
         
-        time.sleep(2)
-        
         # Click the vehicle fitment tab if exists
         try:
             fitment_tab = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.ID, "tab-vehicle-fitment-tab"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", fitment_tab)
-            time.sleep(1)
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", fitment_tab)
             fitment_tab.click()
-            print("    Clicked vehicle fitment tab")
-            time.sleep(5)
+            log.debug("    Clicked vehicle fitment tab")
+            tab_clicked = True
         except Exception as e:
-            print(f"    Note: Could not click fitment tab")
+            log.info(f"    Note: Could not click fitment tab")
+            tab_clicked = False
+        
+        if tab_clicked:
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.visibility_of_element_located((By.CLASS_NAME, "product-fitment"))
+                )
+            except Exception:
+                log.info("    Note: Fitment section did not become visible after clicking the tab")
         
         # Scroll to the fitment section
         try:
             fitment_section = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "product-fitment"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", fitment_section)
-            time.sleep(5)
-            print("    Scrolled to fitment section")
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", fitment_section)
+            log.debug("    Scrolled to fitment section")
         except Exception as e:
-            print(f"    Note: Could not scroll to fitment section")
+            log.info(f"    Note: Could not scroll to fitment section")
         
-        # Additional scrolling to trigger fitment table load
-        print("    Scrolling to trigger fitment table load...")
-        for i in range(5):
-            driver.execute_script("window.scrollBy(0, 500);")
-            time.sleep(0.5)
+        # Scroll to the bottom to trigger fitment table load
+        log.debug("    Scrolling to trigger fitment table load...")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        wait_for_stable_row_count(driver, 10)
         
         # Try to click the fitment expander
         try:
             expander = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.CLASS_NAME, "fitment-expander"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", expander)
-            time.sleep(1)
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", expander)
+            rows_before = count_fitment_rows(driver)
             expander.click()
-            print("    Clicked fitment expander to reveal all rows")
-            time.sleep(5)
+            log.debug("    Clicked fitment expander to reveal all rows")
+            WebDriverWait(driver, 10, poll_frequency=0.25).until(
+                lambda d: count_fitment_rows(d) > rows_before
+            )
+            wait_for_stable_row_count(driver, 10)
         except Exception as e:
-            print(f"    Note: No fitment expander found or could not click")
+            log.info(f"    Note: No fitment expander found or could not click")
         
         # Wait for fitment rows
         try:
             WebDriverWait(driver, 30).until(
                 lambda d: len(d.find_elements(By.CSS_SELECTOR, "tr.fitment-row")) > 0
             )
-            print("    Fitment rows detected after wait")
+            log.debug("    Fitment rows detected after wait")
         except Exception as e:
-            print(f"    Warning: No fitment rows appeared after wait")
+            log.warning(f"    Warning: No fitment rows appeared after wait")
         
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = BeautifulSoup(driver.page_source, 'lxml')
+        return parse_product_soup(soup)
         
-        data = {}
+    except Exception as e:
+        log.error(f"    Error processing {url}: {e}")
+        return None
+
+def open_cache(cache_file):
+    """
+    Open (or create) the on-disk URL -> scraped rows cache
+    """
+    conn = sqlite3.connect(cache_file)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS scrape_cache (url TEXT PRIMARY KEY, fetched_at REAL, rows_json TEXT)"
+    )
+    conn.commit()
+    return conn
+
+def get_cached_rows(conn, url):
+    """
+    Look up a previously scraped URL
+    Returns: list of product rows, or None if missing or older than CACHE_MAX_AGE
+    """
+    cursor = conn.execute(
+        "SELECT rows_json FROM scrape_cache WHERE url=? AND fetched_at > ?",
+        (url, time.time() - CACHE_MAX_AGE)
+    )
+    hit = cursor.fetchone()
+    return json.loads(hit[0]) if hit else None
+
+def store_cached_rows(conn, url, rows):
+    """
+    Save the scraped rows for a URL, replacing any older entry
+    """
+    conn.execute(
+        "INSERT OR REPLACE INTO scrape_cache (url, fetched_at, rows_json) VALUES (?, ?, ?)",
+        (url, time.time(), json.dumps(rows))
+    )
+    conn.commit()
+
+# Per-process driver pool, started on first use so static-only runs never launch Chrome
+_worker_pool = None
+
+# Site origin each new driver loads once before scraping, set by init_worker
+_warm_url = None
+
+def get_worker_pool():
+    """
+    Return this process's driver pool, starting Chrome on first use
+    """
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = DriverPool(size=1, warm_url=_warm_url)
+        # atexit does not run in pool workers; Finalize does
+        multiprocessing.util.Finalize(None, _worker_pool.close, exitpriority=10)
+    return _worker_pool
+
+def init_worker(driver_path, warm_url=None, driver_count=1, log_level=logging.INFO):
+    """
+    ProcessPoolExecutor initializer for each worker process
+    Reuses the chromedriver path resolved by the parent instead of resolving it again
+    """
+    global _CHROMEDRIVER_PATH, _warm_url, _shm_driver_count
+    
+    # spawn/forkserver workers don't inherit the parent's handler; with fork this is a no-op
+    # Only this module's logger gets log_level, so --debug doesn't enable selenium/urllib3 debug output
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    log.setLevel(log_level)
+    
+    _CHROMEDRIVER_PATH = driver_path
+    _warm_url = warm_url
+    _shm_driver_count = driver_count
+    
+    # Forked workers inherit the parent's random state, so reseed for independent delays
+    random.seed()
+    
+    # Stagger worker start so requests are spread out instead of arriving in bursts
+    time.sleep(random.uniform(0, 6))
+
+def worker(row):
+    """
+    Scrape a single input row: HEAD check, then plain HTTP, then this process's persistent driver
+    Returns: list of product rows, or None on failure
+    """
+    url = row['product-image-link href']
+    log.info(f"Processing (pid {os.getpid()}): {url}")
+    
+    product_rows = None
+    if url_is_live(url):
+        product_rows = try_static_fetch(url)
+        if product_rows:
+            log.info("    Extracted from static HTML, skipped Selenium")
+        else:
+            try:
+                pool = get_worker_pool()
+                entry = pool.acquire()
+            except Exception as e:
+                # A driver that won't start fails this URL only, not the whole run
+                log.error(f"    Error starting Chrome for {url}: {e}")
+                entry = None
+            
+            if entry is not None:
+                try:
+                    product_rows = extract_product_data(url, entry[0])
+                finally:
+                    try:
+                        pool.release(entry)
+                    except Exception as e:
+                        log.error(f"    Error returning driver to pool: {e}")
+    
+    # Random delay between requests from this worker
+    delay = random.uniform(3, 6)
+    time.sleep(delay)
+    
+    return product_rows
+
+def scrape_records(records, workers):
+    """
+    Scrape input rows across worker processes
+    Yields: (row, product_rows) in input order
+    """
+    if not records:
+        return
+    driver_path = get_chromedriver_path()
+    warm_url = get_origin(records[0]['product-image-link href'])
+    initargs = (driver_path, warm_url, workers, log.getEffectiveLevel())
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=initargs) as executor:
+        yield from zip(records, executor.map(worker, records, chunksize=4))
+
+async def block_unneeded_requests(route):
+    """
+    Playwright route handler: abort requests of a blocked resource type or matching BLOCKED_URL_PATTERNS
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def count_fitment_rows_async(page):
+    """
+    Count fitment rows currently rendered in a Playwright page
+    """
+    return await page.evaluate("document.querySelectorAll('tr.fitment-row').length")
+
+async def wait_for_stable_row_count_async(page, timeout):
+    """
+    Wait until the fitment row count is non-zero and unchanged across two polls 250 ms apart
+    Returns: True if the count settled, False on timeout
+    """
+    last_count = -1
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        count = await count_fitment_rows_async(page)
+        if count > 0 and count == last_count:
+            return True
+        last_count = count
+        await asyncio.sleep(0.25)
+    return False
+
+async def extract_product_data_async(url, browser):
+    """
+    Extract product data from a Mopar parts page in its own Playwright browser context
+    Mirrors extract_product_data, then hands the HTML to the shared bs4 parsing
+    Returns: list of dictionaries, one for each fitment (year/make/model)
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    context = None
+    try:
+        context = await browser.new_context(user_agent=USER_AGENT, viewport={'width': 1920, 'height': 1080})
+        await context.route("**/*", block_unneeded_requests)
+        page = await context.new_page()
         
-        # Extract product title
-        title_elem = soup.find('h1', class_='product-title')
-        data['Product Title'] = title_elem.text.strip() if title_elem else ''
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=20000)
+        except PlaywrightTimeoutError:
+            # Slow tail resources shouldn't block us; the element waits below decide
+            log.info("    Note: Page load timed out, continuing with element waits")
         
-        # Extract product subtitle
-        subtitle_elem = soup.find('p', class_='product-subtitle')
-        data['Product Subtitle'] = subtitle_elem.text.strip() if subtitle_elem else ''
+        # Wait for product title
+        await page.wait_for_selector(".product-title", state='attached', timeout=15000)
         
-        # Extract manufacturer info
-        manufacturer_strong = soup.find('strong', string='Genuine Mopar Parts')
-        data['Manufacturer Info'] = manufacturer_strong.text.strip() if manufacturer_strong else ''
+        # Click the vehicle fitment tab if exists
+        try:
+            await page.click("#tab-vehicle-fitment-tab", timeout=10000)
+            log.debug("    Clicked vehicle fitment tab")
+            tab_clicked = True
+        except Exception:
+            log.info("    Note: Could not click fitment tab")
+            tab_clicked = False
         
-        # Extract fields from ALL field-lists
-        field_lists = soup.find_all('ul', class_='field-list')
-        field_tracker = {}
+        if tab_clicked:
+            try:
+                await page.wait_for_selector(".product-fitment", state='visible', timeout=10000)
+            except Exception:
+                log.info("    Note: Fitment section did not become visible after clicking the tab")
         
-        for field_list in field_lists:
-            items = field_list.find_all('li')
-            for item in items:
-                label_elem = item.find(['label', 'span'], class_='list-label')
-                value_elem = item.find(['span', 'h2'], class_=['list-value', 'sku-display'])
-                
-                if not label_elem or not value_elem:
-                    continue
-                
-                label = label_elem.text.strip().replace(':', '').strip()
-                value = value_elem.text.strip()
-                
-                if not label or label.startswith('$') or re.match(r'^\d+$', label):
-                    continue
-                
-                if label in field_tracker:
-                    field_tracker[label] += 1
-                    field_name = f"{label} {field_tracker[label]}"
-                else:
-                    field_tracker[label] = 1
-                    field_name = label
-                
-                data[field_name] = value
-        
-        # Extract description
-        description_div = soup.find('div', class_='description_body')
-        if description_div:
-            description_text = description_div.get_text(separator=' ', strip=True)
-            data['Description'] = description_text
-        
-        # Extract notes
-        notes_items = soup.find_all('li', class_='notes')
-        if notes_items:
-            notes_list = [item.get_text(strip=True) for item in notes_items]
-            data['Notes'] = ' | '.join(notes_list)
-        
-        # Extract pricing
-        msrp_elem = soup.find('span', class_='list-price-value')
-        if msrp_elem:
-            data['MSRP'] = msrp_elem.text.strip()
-        
-        sale_price_elem = soup.find('strong', class_='sale-price-value')
-        if sale_price_elem:
-            data['Sale Price'] = sale_price_elem.text.strip()
-        
-        # Extract vehicle fitment data
-        fitments = extract_fitment_data(soup)
-        
-        # Filter to allowed keys
-        allowed_keys = [
-            'Product Title', 'Product Subtitle', 'Manufacturer Info', 'SKU', 
-            'Other Names', 'Description', 'Description 2', 'Replaces',  
-            'MSRP', 'Discount', 'Sale Price', 'Condition', 'Install Time', 'Applications', 'Notes'
-        ]
-        filtered_data = {k: data[k] for k in allowed_keys if k in data}
-        
-        # Create a row for each fitment
-        result_rows = []
-        if fitments:
-            for fitment in fitments:
-                row = filtered_data.copy()
-                row.update(fitment)
-                result_rows.append(row)
-        else:
-            row = filtered_data.copy()
-            row['Year'] = ''
-            row['Make'] = ''
-            row['Model'] = ''
-            row['Body & Trim'] = ''
-            row['Engine & Transmission'] = ''
-            result_rows.append(row)
+        # Scroll to the bottom to trigger fitment table load
+        log.debug("    Scrolling to trigger fitment table load...")
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+        await wait_for_stable_row_count_async(page, 10)
         
-        return result_rows
+        # Try to click the fitment expander
+        try:
+            rows_before = await count_fitment_rows_async(page)
+            await page.click(".fitment-expander", timeout=10000)
+            log.debug("    Clicked fitment expander to reveal all rows")
+            await page.wait_for_function(
+                "n => document.querySelectorAll('tr.fitment-row').length > n", arg=rows_before, timeout=10000
+            )
+            await wait_for_stable_row_count_async(page, 10)
+        except Exception:
+            log.info("    Note: No fitment expander found or could not click")
+        
+        # Wait for fitment rows
+        try:
+            await page.wait_for_selector("tr.fitment-row", state='attached', timeout=30000)
+            log.debug("    Fitment rows detected after wait")
+        except Exception:
+            log.warning("    Warning: No fitment rows appeared after wait")
         
+        soup = BeautifulSoup(await page.content(), 'lxml')
+        return parse_product_soup(soup)
+    
     except Exception as e:
-        print(f"    Error processing {url}: {e}")
+        log.error(f"    Error processing {url}: {e}")
         return None
     finally:
-        if driver is not None:
-            driver.quit()
-        # Clean up the temporary profile
-        if profile_path is not None:
-            cleanup_profile(profile_path)
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                log.warning(f"    Warning: Could not close browser context: {e}")
+
+async def scrape_one_async(row, browser, semaphore):
+    """
+    Scrape a single input row: HEAD check, then plain HTTP, then a Playwright tab
+    At most `semaphore` rows are in flight at once, each followed by the usual random delay
+    """
+    url = row['product-image-link href']
+    async with semaphore:
+        log.info(f"Processing: {url}")
+        product_rows = None
+        if await asyncio.to_thread(url_is_live, url):
+            product_rows = await asyncio.to_thread(try_static_fetch, url)
+            if product_rows:
+                log.info("    Extracted from static HTML, skipped Playwright")
+            else:
+                product_rows = await extract_product_data_async(url, browser)
+        
+        # Random delay before this slot takes the next URL
+        await asyncio.sleep(random.uniform(3, 6))
+    return product_rows
+
+def scrape_records_playwright(records, concurrency):
+    """
+    Scrape input rows as concurrent tabs of one headless Chromium driven by asyncio
+    Yields: (row, product_rows) in input order, as soon as each row is done
+    """
+    if not records:
+        return
+    # Optional dependency, only needed for --backend playwright
+    from playwright.async_api import async_playwright
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    playwright = loop.run_until_complete(async_playwright().start())
+    browser = None
+    try:
+        browser = loop.run_until_complete(playwright.chromium.launch(
+            headless=True, args=['--no-sandbox', '--disable-dev-shm-usage']
+        ))
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [loop.create_task(scrape_one_async(row, browser, semaphore)) for row in records]
+        
+        # Waiting on each task in turn keeps every other task running in the background
+        for row, task in zip(records, tasks):
+            yield row, loop.run_until_complete(task)
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        if browser is not None:
+            loop.run_until_complete(browser.close())
+        loop.run_until_complete(playwright.stop())
+        loop.close()
+
+def restore_input_dtypes(final_df, input_df):
+    """
+    Give input-sheet columns back their native types after the all-text round trip through the partial CSV
+    Scraped fields stay text; numeric, boolean and date input columns are converted back
+    """
+    scraped_columns = set(ALLOWED_KEYS + FITMENT_COLUMNS)
+    for col in input_df.columns:
+        # The CSV header stringifies column names
+        key = str(col)
+        if col in scraped_columns or key not in final_df.columns:
+            continue
+        
+        dtype = input_df[col].dtype
+        values = final_df[key].replace('', float('nan'))
+        try:
+            if pd.api.types.is_bool_dtype(dtype):
+                final_df[key] = values.map({'True': True, 'False': False})
+            elif pd.api.types.is_numeric_dtype(dtype):
+                final_df[key] = pd.to_numeric(values)
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                final_df[key] = pd.to_datetime(values)
+        except (ValueError, TypeError) as e:
+            log.warning(f"Warning: Keeping column {key!r} as text: {e}")
+    
+    return final_df.rename(columns={str(col): col for col in input_df.columns})
+
+def write_excel(df, output_file):
+    """
+    Write a DataFrame to .xlsx, using the faster write-only xlsxwriter engine when installed
+    """
+    if importlib.util.find_spec('xlsxwriter') is None:
+        df.to_excel(output_file, index=False)
+        return
+    
+    # Write text as text like openpyxl does: xlsxwriter's defaults turn URLs into hyperlinks
+    # (capped at 65,530 per sheet, extra cells are dropped) and strings starting with '=' into formulas
+    options = {'strings_to_urls': False, 'strings_to_formulas': False}
+    with pd.ExcelWriter(output_file, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
+        df.to_excel(writer, index=False)
 
-def process_excel_file(input_file, output_file=None):
+def process_excel_file(input_file, output_file=None, workers=4, cache_file=None, force=False, excel=True, backend='selenium'):
     """
-    Process Excel file with product URLs and extract data sequentially
-    One URL at a time, with fresh profile for each
+    Process Excel file with product URLs and extract data in parallel
+    With the selenium backend each worker process keeps one Chrome driver alive across its URLs;
+    with the playwright backend `workers` tabs share one browser
+    URLs already in the cache are reused unless force is set
+    Results are saved as Parquet next to output_file, plus the .xlsx itself when excel is set
     """
     # Read the Excel file
     try:
         df = pd.read_excel(input_file)
     except Exception as e:
-        print(f"Error reading Excel file: {e}")
+        log.error(f"Error reading Excel file: {e}")
         return
     
     if 'product-image-link href' not in df.columns:
-        print("Error: Column 'product-image-link href' not found")
+        log.error("Error: Column 'product-image-link href' not found")
         return
     
     original_columns = list(df.columns)
-    print(f"Original columns: {original_columns}\n")
+    log.info(f"Original columns: {original_columns}\n")
     
-    all_rows = []
     total_rows = len(df)
+    row_count = 0
     success_count = 0
     processed_count = 0
     
-    # Process URLs sequentially
-    for idx, (_, row) in enumerate(df.iterrows()):
+    cache = open_cache(cache_file) if cache_file else None
+    
+    # Stream rows to a CSV as they arrive instead of rewriting the whole workbook
+    partial_file = output_file + ".partial.csv"
+    parquet_file = os.path.splitext(output_file)[0] + ".parquet"
+    fieldnames = list(dict.fromkeys(ALLOWED_KEYS + FITMENT_COLUMNS + original_columns))
+    
+    # Every input row with a URL, in sheet order; cached rows carry their results, the rest go to the scraper
+    planned = []
+    records = []
+    for idx, row in enumerate(df.to_dict('records')):
         url = row['product-image-link href']
-        
         if pd.isna(url) or url == '':
-            print(f"Skipping row {idx + 1}: No URL found")
+            log.info(f"Skipping row {idx + 1}: No URL found")
             continue
         
-        print(f"Processing {idx + 1}/{total_rows}: {url}")
+        # Empty Excel cells come back as NaN; write them out as blanks
+        row = {k: ('' if pd.isna(v) else v) for k, v in row.items()}
         
-        product_rows = extract_product_data(url)
+        cached_rows = get_cached_rows(cache, url) if cache is not None and not force else None
+        planned.append((row, cached_rows))
+        if cached_rows is None:
+            records.append(row)
+    
+    total_urls = len(planned)
+    if total_urls > len(records):
+        log.info(f"Using cached results for {total_urls - len(records)} URL(s), scraping {len(records)}\n")
+    
+    if backend == 'playwright':
+        results = scrape_records_playwright(records, workers)
+    else:
+        results = scrape_records(records, workers)
+    
+    def in_input_order():
+        # Scraper results come back in records order, so interleaving them with cached rows keeps sheet order
+        for row, cached_rows in planned:
+            if cached_rows is not None:
+                yield row, cached_rows, True
+            else:
+                scraped_row, product_rows = next(results)
+                yield scraped_row, product_rows, False
+    
+    # The with block closes the CSV even if the scrape loop raises
+    with open(partial_file, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, restval='', extrasaction='ignore')
+        writer.writeheader()
         
-        if product_rows:
-            for product_row in product_rows:
-                for orig_col in original_columns:
-                    if orig_col not in product_row and orig_col in row:
-                        product_row[orig_col] = row[orig_col]
+        for row, product_rows, from_cache in in_input_order():
+            url = row['product-image-link href']
+            processed_count += 1
+            source = "cached" if from_cache else "scraped"
+            log.info(f"Completed {processed_count}/{total_urls} ({total_rows} rows in sheet, {source}): {url}")
             
-            all_rows.extend(product_rows)
-            success_count += 1
-            print(f"  ✓ Data extracted successfully: {len(product_rows)} fitment row(s)\n")
+            # Only cache pages that yielded fitments; a blank-fitment row may be a timed-out render
+            if product_rows and cache is not None and not from_cache and any(r.get('Year') for r in product_rows):
+                store_cached_rows(cache, url, product_rows)
+            
+            if product_rows:
+                # Input columns fill in anything the scraped row doesn't already have
+                product_rows = [{**row, **product_row} for product_row in product_rows]
+                
+                writer.writerows(product_rows)
+                csv_file.flush()
+                row_count += len(product_rows)
+                success_count += 1
+                log.info(f"  ✓ Data extracted successfully: {len(product_rows)} fitment row(s)\n")
+            else:
+                log.error(f"  ✗ Failed to extract data\n")
+    
+    # Final save: the workbook when asked for, plus Parquet; each output is attempted independently
+    if row_count:
+        saved_all = False
+        try:
+            final_df = restore_input_dtypes(pd.read_csv(partial_file, dtype=str, keep_default_na=False), df)
+        except Exception as e:
+            log.error(f"Error reading partial results: {e}")
         else:
-            print(f"  ✗ Failed to extract data\n")
-        
-        processed_count += 1
-        
-        # Save progress every 10 successful extractions
-        if success_count % 10 == 0:
+            saved_all = True
+            if excel:
+                try:
+                    write_excel(final_df, output_file)
+                    log.info(f"\n✓ Final data saved to {output_file}")
+                except Exception as e:
+                    log.error(f"Error saving Excel file: {e}")
+                    saved_all = False
+            
             try:
-                new_df = pd.DataFrame(all_rows)
-                new_df.to_excel(output_file, index=False)
-                print(f"\n✓ Progress saved to {output_file} after {success_count} successful extractions ({len(all_rows)} total rows)\n")
+                final_df.to_parquet(parquet_file, compression='zstd', index=False)
+                log.info(f"✓ Final data saved to {parquet_file}")
             except Exception as e:
-                print(f"Error saving progress: {e}\n")
+                log.error(f"Error saving Parquet file (is pyarrow installed?): {e}")
+                saved_all = False
+            
+            log.info(f"  Total rows: {len(final_df)} ({success_count} successful extractions out of {processed_count})")
         
-        # Random delay between requests
-        if idx < total_rows - 1:  # Don't delay after last URL
-            delay = random.uniform(3, 6)
-            print(f"Waiting {delay:.1f} seconds before next request...\n")
-            time.sleep(delay)
-    
-    # Final save
-    if all_rows:
-        try:
-            final_df = pd.DataFrame(all_rows)
-            final_df.to_excel(output_file, index=False)
-            print(f"\n✓ Final data saved to {output_file}")
-            print(f"  Total rows: {len(final_df)} ({success_count} successful extractions out of {processed_count})")
-        except Exception as e:
-            print(f"Error saving Excel file: {e}")
+        if saved_all:
+            os.remove(partial_file)
+        else:
+            log.info(f"  Partial results remain in {partial_file}")
     else:
-        print(f"\n✗ No data extracted from {processed_count} URLs")
+        log.info(f"\n✗ No data extracted from {processed_count} URLs")
+    
+    if cache is not None:
+        cache.close()
 
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Mopar product pages listed in an Excel file")
+    parser.add_argument('--force', action='store_true', help="Ignore cached results and re-scrape every URL")
+    parser.add_argument('--workers', type=int, default=4, help="Number of parallel Chrome worker processes (or tabs with playwright)")
+    parser.add_argument('--backend', choices=['selenium', 'playwright'], default='selenium',
+                        help="selenium: one Chrome per worker process; playwright: async tabs in one browser")
+    parser.add_argument('--debug', action='store_true', help="Log per-row fitment details and Selenium steps")
+    parser.add_argument('--no-excel', action='store_true', help="Only write the Parquet output, skip the .xlsx")
+    args = parser.parse_args()
+    
+    # Root stays at INFO so library loggers (selenium, urllib3) don't flood the output under --debug
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    log.setLevel(logging.DEBUG if args.debug else logging.INFO)
+    
     # Input file path for AWS (Linux path)
     input_dir = "/home/ubuntu/gm2"
     input_file = os.path.join(input_dir, "wheelslist.xlsx")
@@ -385,17 +1131,31 @@ if __name__ == "__main__":
     output_dir = "/home/ubuntu/gm2"
     output_file = os.path.join(output_dir, "wheelslist-updated.xlsx")
     
-    print("="*70)
-    print("Starting sequential web scraping process (headless mode)")
-    print("="*70)
-    print(f"Input file: {input_file}")
-    print(f"Output file: {output_file}")
-    print(f"Processing mode: Sequential (one URL at a time)")
-    print(f"Profile mode: Fresh Chrome profile for each URL")
-    print("="*70 + "\n")
+    # URL -> scraped rows cache, reused across reruns
+    cache_file = os.path.join(output_dir, "scrape_cache.sqlite")
+    
+    # Number of parallel Chrome worker processes
+    workers = args.workers
+    
+    log.info("="*70)
+    log.info("Starting parallel web scraping process (headless mode)")
+    log.info("="*70)
+    log.info(f"Input file: {input_file}")
+    log.info(f"Output file: {output_file}{' (skipped, --no-excel)' if args.no_excel else ''}")
+    if args.backend == 'playwright':
+        log.info(f"Processing mode: Parallel ({workers} async tabs)")
+        log.info("Profile mode: One shared Chromium, fresh context per URL")
+    else:
+        log.info(f"Processing mode: Parallel ({workers} worker processes)")
+        log.info(f"Profile mode: One persistent Chrome driver per worker")
+    log.info(f"Cache file: {cache_file}{' (ignored, --force)' if args.force else ''}")
+    log.info("="*70 + "\n")
     
-    process_excel_file(input_file, output_file)
+    process_excel_file(
+        input_file, output_file, workers=workers, cache_file=cache_file,
+        force=args.force, excel=not args.no_excel, backend=args.backend
+    )
     
-    print("\n" + "="*70)
-    print("Process completed!")
-    print("="*70)
\ No newline at end of file
+    log.info("\n" + "="*70)
+    log.info("Process completed!")
+    log.info("="*70)
\ No newline at end of file